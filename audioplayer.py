@@ -4,13 +4,14 @@ from datetime import timedelta
 import flet as ft
 from flet import CrossAxisAlignment, MainAxisAlignment, icons
 
-from utils import format_timedelta_str_ms, get_src_dir_contents
+from utils import format_timedelta_str_ms, get_src_dir_formats
 
 # from inside, this control is just a Column control,
 # so, asking about vertical and horizontal alignments makes sense
 
 
-# for now, only mp3 format is supported
+# files are picked up if they look like mp3, flac, ogg, opus, m4a, aac or wav,
+# whether they actually play depends on what ft.Audio supports on the platform
 class AudioPlayer(ft.Container):
     def __init__(
         self,
@@ -41,7 +42,6 @@ class AudioPlayer(ft.Container):
         self.__curr_idx = curr_idx
 
         self.src_dir = src_dir
-        self.src_dir_contents = get_src_dir_contents(self.src_dir)
 
         self.curr_song_name = self.src_dir_contents[self.curr_idx]
         self.seek_bar = ft.ProgressBar(width=self.width)
@@ -216,7 +216,9 @@ class AudioPlayer(ft.Container):
     @src_dir.setter
     def src_dir(self, value):
         self.__src_dir = value
-        self.src_dir_contents = get_src_dir_contents(value)
+        # audio file path -> format detected from its magic bytes
+        self.src_dir_formats = get_src_dir_formats(value)
+        self.src_dir_contents = list(self.src_dir_formats)
 
     def prev_next_music(self, e):
         if e.control.data == "next":
@@ -0,0 +1,64 @@
+import pytest
+
+from utils import get_src_dir_formats, sniff_audio_format
+
+MP3_FRAME = b"\xff\xfb\x90\x00"  # mpeg 1, layer III, 128 kbps, 44.1 kHz
+ADTS_FRAME = b"\xff\xf1\x50\x80"
+# id3v2.4 tag header with a synchsafe size of 0x81 (1 << 7 | 1) = 129 bytes
+ID3_TAG = b"ID3\x04\x00\x00\x00\x00\x01\x01" + b"\x00" * 129
+
+
+def ftyp(brand: bytes):
+    return b"\x00\x00\x00\x18ftyp" + brand + b"\x00\x00\x00\x00"
+
+
+def write(tmp_path, name: str, data: bytes):
+    path = tmp_path / name
+    path.write_bytes(data + b"\x00" * 64)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "name, data, expected",
+    [
+        ("a.mp3", MP3_FRAME, "mp3"),
+        ("a.MP3", MP3_FRAME, "mp3"),
+        ("a.mp3", ID3_TAG + MP3_FRAME, "mp3"),
+        ("a.flac", b"fLaC", "flac"),
+        ("a.flac", ID3_TAG + b"fLaC", "flac"),
+        ("a.aac", ADTS_FRAME, "aac"),
+        ("a.aac", ID3_TAG + ADTS_FRAME, "aac"),
+        ("a.ogg", b"OggS" + b"\x00" * 24 + b"\x01vorbis", "ogg"),
+        ("a.opus", b"OggS" + b"\x00" * 24 + b"OpusHead", "opus"),
+        ("a.m4a", ftyp(b"M4A "), "m4a"),
+        ("a.m4a", ftyp(b"isom"), "m4a"),
+        ("a.wav", b"RIFF\x24\x00\x00\x00WAVE", "wav"),
+    ],
+)
+def test_sniff_audio_format(tmp_path, name, data, expected):
+    assert sniff_audio_format(write(tmp_path, name, data)) == expected
+
+
+@pytest.mark.parametrize(
+    "name, data",
+    [
+        ("a.txt", "hi".encode("utf-16")),
+        ("a.txt", b"hello"),
+        ("a.mp4", ftyp(b"isom")),
+        ("a.mp4", ftyp(b"mp42")),
+        ("a.heic", ftyp(b"heic")),
+        ("a.mp3", b"\xff\xfb\xf0\x00"),  # bad bitrate index
+        ("a.mp3", b"\xff\xeb\x90\x00"),  # reserved version
+        ("a.mp3", ID3_TAG + b"hello"),
+    ],
+)
+def test_sniff_audio_format_rejects(tmp_path, name, data):
+    assert sniff_audio_format(write(tmp_path, name, data)) is None
+
+
+def test_get_src_dir_formats(tmp_path):
+    (tmp_path / "folder.mp3").mkdir()
+    flac = write(tmp_path, "b.flac", b"fLaC")
+    write(tmp_path, "c.txt", "hi".encode("utf-16"))
+
+    assert get_src_dir_formats(str(tmp_path)) == {flac: "flac"}
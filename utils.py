@@ -1,4 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# only this many bytes of a file are read to figure out its format
+PROBE_SIZE = 64
 
 
 # request this only when you have done timedelta(milliseconds=...)
@@ -29,10 +33,100 @@ def format_timedelta_str_ms(timedelta_milliseconds_str: str):
     return ":".join(time_)
 
 
-def get_src_dir_contents(dir_path: str):
-    return [
+# major brands of iso-bmff (mp4) files that are audio only
+M4A_BRANDS = {b"M4A ", b"M4B ", b"M4P ", b"F4A "}
+# generic brands, used by audio and video alike, so the extension has to agree
+GENERIC_MP4_BRANDS = {b"mp42", b"isom"}
+
+
+def _is_mp3_frame(header: bytes):
+    # 11 bit frame sync, the version must not be the reserved 01,
+    # and only layer III is taken as mp3
+    if len(header) < 3 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return False
+    if header[1] & 0x18 == 0x08 or header[1] & 0x06 != 0x02:
+        return False
+    # bitrate index 1111 and sample rate index 11 are both invalid
+    return header[2] & 0xF0 != 0xF0 and header[2] & 0x0C != 0x0C
+
+
+def _is_adts_frame(header: bytes):
+    # 12 bit sync word followed by layer 00
+    return len(header) >= 2 and header[0] == 0xFF and header[1] & 0xF6 == 0xF0
+
+
+def _sniff_header(header: bytes, extension: str):
+    if header.startswith(b"fLaC"):
+        return "flac"
+    if header.startswith(b"OggS"):
+        # opus streams are ogg containers whose first packet is "OpusHead"
+        return "opus" if b"OpusHead" in header else "ogg"
+    if header[4:8] == b"ftyp":
+        brand = header[8:12]
+        if brand in M4A_BRANDS or (
+            brand in GENERIC_MP4_BRANDS and extension in ("m4a", "m4b")
+        ):
+            return "m4a"
+        return None
+    if header.startswith(b"RIFF") and header[8:12] == b"WAVE":
+        return "wav"
+    if _is_adts_frame(header):
+        return "aac"
+    if _is_mp3_frame(header):
+        return "mp3"
+
+    return None
+
+
+def sniff_audio_format(file_path: str):
+    """
+    Identify the audio format of a file from its magic bytes.
+    Only the first PROBE_SIZE bytes are read, never the whole file
+    (plus one more PROBE_SIZE read past an ID3 tag, if there is one).
+
+    Examples:
+    sniff_audio_format("song.mp3") -> "mp3"
+    sniff_audio_format("notes.txt") -> None
+    """
+    extension = file_path.rsplit(".", 1)[-1].lower()
+    try:
+        with open(file_path, "rb", buffering=PROBE_SIZE) as f:
+            header = f.read(PROBE_SIZE)
+            # id3v2 tags can precede mp3, flac and aac alike,
+            # so skip the tag and look at what comes after it
+            if header.startswith(b"ID3") and len(header) >= 10:
+                # the size is synchsafe: 7 bits used in each of the 4 bytes
+                tag_size = 0
+                for byte in header[6:10]:
+                    tag_size = (tag_size << 7) | (byte & 0x7F)
+                tag_size += 10
+                if header[5] & 0x10:  # footer present
+                    tag_size += 10
+                f.seek(tag_size)
+                header = f.read(PROBE_SIZE)
+    except OSError:
+        return None
+
+    return _sniff_header(header, extension)
+
+
+def get_src_dir_formats(dir_path: str):
+    """
+    Map every audio file in dir_path to its format, e.g. {"/music/a.flac": "flac"}.
+    Files are probed concurrently, files with an unknown format are left out.
+    """
+    file_paths = [
         os.path.join(dir_path, folder_content)
         for folder_content in os.listdir(dir_path)
-        if folder_content.split(".")[-1] == "mp3"
-        and not os.path.isdir(os.path.join(dir_path, folder_content))
+        if not os.path.isdir(os.path.join(dir_path, folder_content))
     ]
+
+    with ThreadPoolExecutor() as executor:
+        formats = executor.map(sniff_audio_format, file_paths)
+
+    return {
+        file_path: format_
+        for file_path, format_ in zip(file_paths, formats)
+        if format_ is not None
+    }
+